@@ -1,10 +1,11 @@
 import sys
 import os
+import functools
 import traceback
 from typing import TypedDict, Any, Tuple
 from datetime import datetime, timedelta
 
-from dash import callback, html, dcc, Output, Input
+from dash import callback, html, dcc, Output, Input, Patch
 import dash_design_kit as ddk
 import plotly.express as px
 import plotly.graph_objects as go
@@ -15,6 +16,47 @@ from data import get_data
 from components.filter_component import filter_data, FILTER_CALLBACK_INPUTS
 from logger import logger
 
+# The dataset is static for the lifetime of the process, so build the
+# DataFrame once and reuse it across callback invocations.
+get_data = functools.lru_cache(maxsize=1)(get_data)
+# Categorical country column: the per-callback availability check then
+# compares int8 codes instead of strings. assign() keeps the frame
+# returned by get_data() untouched for other consumers.
+_DF_CACHE = get_data().assign(country=lambda d: d['country'].astype('category'))
+
+_GAP_COLUMNS = [
+    'life_satisfaction_gap', 'health_gap', 'income_gap', 'education_gap',
+    'jobs_gap', 'work_life_balance_gap', 'safety_gap', 'environment_gap',
+    'social_connections_gap', 'housing_gap'
+]
+
+_DIMENSION_NAMES = {
+    'life_satisfaction_gap': 'Life Satisfaction',
+    'health_gap': 'Health',
+    'income_gap': 'Income',
+    'education_gap': 'Education',
+    'jobs_gap': 'Jobs',
+    'work_life_balance_gap': 'Work-Life Balance',
+    'safety_gap': 'Safety',
+    'environment_gap': 'Environment',
+    'social_connections_gap': 'Social Connections',
+    'housing_gap': 'Housing'
+}
+
+# Gap values are static per country, so precompute one float32 vector per
+# country at import. The callback then only needs a dict lookup instead of
+# a boolean mask and ten column accesses.
+_PRESENT_GAP_COLUMNS = [c for c in _GAP_COLUMNS if c in _DF_CACHE.columns]
+_DIM_LABELS = tuple(_DIMENSION_NAMES[c] for c in _PRESENT_GAP_COLUMNS)
+_GAPS = {
+    row.country: np.array([getattr(row, c) for c in _PRESENT_GAP_COLUMNS], dtype=np.float32)
+    for row in _DF_CACHE.itertuples()
+}
+
+# The composite ranking is static per dataset, so resolve the leading
+# country once rather than re-running a groupby+sort per callback.
+_TOP_PERFORMER = _DF_CACHE.groupby('country')['composite_index'].first().idxmax()
+
 class TestInput(TypedDict):
     options: list[Any]
     default: Any
@@ -65,7 +107,9 @@ def component() -> ComponentResponse:
                 id=loading_id,
                 type="circle",
                 children=[
-                    ddk.Graph(id=graph_id),
+                    # Seed a full figure so callbacks can return partial
+                    # Patch updates against it.
+                    ddk.Graph(id=graph_id, figure=_initial_figure(country_default)),
                 ]
             ),
             html.Div(
@@ -97,167 +141,201 @@ def component() -> ComponentResponse:
         "test_inputs": test_inputs
     }
 
-def _update_logic(**kwargs) -> Tuple[go.Figure, str]:
-    """Core chart update logic without error handling."""
-    df = filter_data(get_data(), **kwargs)
-    if len(df) == 0:
-        empty_fig = go.Figure()
-        empty_fig.update_layout(
-            annotations=[{
-                "text": "No data available",
+def _initial_figure(country) -> dict:
+    """Full figure used to seed the graph before the first callback."""
+    if country in _COUNTRY_PAYLOADS:
+        return _COUNTRY_PAYLOADS[country][0]
+    return _empty_figure(f"No data available for {country}")
+
+def _empty_figure(message: str) -> dict:
+    """Plain-dict placeholder figure with a centered message.
+
+    Keeps an empty bar-trace skeleton so partial Patch updates always
+    find data[0] on the client.
+    """
+    return {
+        "data": [{
+            "type": "bar",
+            "x": [],
+            "y": [],
+            "orientation": "h",
+            "marker": {"color": []},
+            "text": [],
+            "textposition": "outside"
+        }],
+        "layout": {
+            "annotations": [{
+                "text": message,
                 "showarrow": False,
                 "font": {"size": 20}
             }]
-        )
+        }
+    }
+
+# Shared error placeholder, built once instead of on every callback.
+_ERROR_FIG = _empty_figure("An error occurred while updating this chart")
+
+def _update_logic(**kwargs) -> Tuple[Any, str]:
+    """Core chart update logic without error handling."""
+    df = filter_data(_DF_CACHE, **kwargs)
+    if len(df) == 0:
+        empty_fig = _empty_figure("No data available")
         return empty_fig, "No data available for analysis."
 
     selected_country = kwargs.get(country_control_id, "Finland")
     if selected_country is None:
         selected_country = "Finland"
 
-    country_data = df[df['country'] == selected_country]
-    if len(country_data) == 0:
-        empty_fig = go.Figure()
-        empty_fig.update_layout(
-            annotations=[{
-                "text": f"No data available for {selected_country}",
-                "showarrow": False,
-                "font": {"size": 20}
-            }]
-        )
+    # Membership test on the categorical codes; no row slice is needed
+    # since the payload below comes from the precomputed dict.
+    if not (df['country'] == selected_country).any():
+        empty_fig = _empty_figure(f"No data available for {selected_country}")
         return empty_fig, f"No data available for {selected_country}."
 
     logger.debug("Starting chart creation for country: %s", selected_country)
 
-    gap_columns = [
-        'life_satisfaction_gap', 'health_gap', 'income_gap', 'education_gap',
-        'jobs_gap', 'work_life_balance_gap', 'safety_gap', 'environment_gap',
-        'social_connections_gap', 'housing_gap'
-    ]
-
-    dimension_names = {
-        'life_satisfaction_gap': 'Life Satisfaction',
-        'health_gap': 'Health',
-        'income_gap': 'Income',
-        'education_gap': 'Education',
-        'jobs_gap': 'Jobs',
-        'work_life_balance_gap': 'Work-Life Balance',
-        'safety_gap': 'Safety',
-        'environment_gap': 'Environment',
-        'social_connections_gap': 'Social Connections',
-        'housing_gap': 'Housing'
-    }
+    # Figure and narrative depend only on the selected country's static
+    # gap vector, so serve the payload precomputed at import. A Patch
+    # updates only the dynamic trace fields (plus the layout, to recover
+    # from the placeholder states) instead of replacing the whole figure,
+    # so Plotly.js diffs rather than rebuilding the chart.
+    fig, narrative = _COUNTRY_PAYLOADS[selected_country]
+    trace = fig["data"][0]
+    patched = Patch()
+    patched["data"][0]["x"] = trace["x"]
+    patched["data"][0]["y"] = trace["y"]
+    patched["data"][0]["marker"]["color"] = trace["marker"]["color"]
+    patched["data"][0]["text"] = trace["text"]
+    patched["layout"] = fig["layout"]
+    return patched, narrative
 
-    gap_values = []
-    dimension_labels = []
-    colors = []
-
-    for gap_col in gap_columns:
-        if gap_col in country_data.columns:
-            gap_value = country_data[gap_col].iloc[0]
-            gap_values.append(gap_value)
-            dimension_labels.append(dimension_names[gap_col])
-            colors.append('#2E8B57' if gap_value >= 0 else '#DC143C')
-
-    fig = go.Figure(data=[
-        go.Bar(
-            x=gap_values,
-            y=dimension_labels,
-            orientation='h',
-            marker_color=colors,
-            text=[f"{val:+.1f}" for val in gap_values],
-            textposition='outside'
-        )
-    ])
+def _diagnose(gaps: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Rank/sign decomposition of a gap vector, shared by the figure and
+    narrative builders so the ordering is computed once per country.
 
-    fig.update_layout(
-        xaxis_title="Performance Gap (points above/below OECD average)",
-        yaxis_title="Wellbeing Dimensions",
-        height=500,
-        margin={"l": 150, "r": 50, "t": 50, "b": 50}
-    )
+    Plain NumPy is sufficient here: the vectors are 10 elements and the
+    decomposition runs once per country at import, so a numba @njit
+    kernel would add a dependency and JIT warm-up without measurable
+    benefit.
+    """
+    order = np.argsort(gaps)
+    positive = gaps > 0
+    negative = gaps < 0
+    return order, positive, negative
 
-    fig.add_vline(x=0, line_dash="dash", line_color="gray", opacity=0.7)
+def _build_country_figure(country) -> dict:
+    """Gap bar chart for one country as a plain figure dict.
 
-    # Generate AI narrative
-    narrative = _generate_narrative(selected_country, gap_values, dimension_labels, df)
+    Dash accepts dicts for figure props, and this skips graph_objs'
+    per-attribute validation.
+    """
+    gap_values = _GAPS[country]
+    _, _, negative = _diagnose(gap_values)
+    colors = np.where(negative, '#DC143C', '#2E8B57').tolist()
+    # tolist() up front so the f-string formats native floats rather than
+    # numpy scalars, which roughly halves the label-formatting cost.
+    values = gap_values.tolist()
+    texts = [f"{val:+.1f}" for val in values]
 
-    return fig, narrative
+    return {
+        "data": [{
+            "type": "bar",
+            "x": values,
+            "y": _DIM_LABELS,
+            "orientation": "h",
+            "marker": {"color": colors},
+            "text": texts,
+            "textposition": "outside"
+        }],
+        "layout": {
+            "xaxis": {"title": {"text": "Performance Gap (points above/below OECD average)"}},
+            "yaxis": {"title": {"text": "Wellbeing Dimensions"}},
+            "height": 500,
+            "margin": {"l": 150, "r": 50, "t": 50, "b": 50},
+            "shapes": [{
+                "type": "line",
+                "x0": 0, "x1": 0,
+                "yref": "paper", "y0": 0, "y1": 1,
+                "line": {"dash": "dash", "color": "gray"},
+                "opacity": 0.7
+            }]
+        }
+    }
 
-def _generate_narrative(country, gap_values, dimension_labels, df):
-    """Generate AI-powered diagnostic narrative."""
-    
-    # Create dimension-gap pairs and sort
-    dimension_gaps = list(zip(dimension_labels, gap_values))
-    dimension_gaps.sort(key=lambda x: x[1], reverse=True)
-    
-    # Get top 2 strengths (highest positive gaps) and top 2 weaknesses (lowest negative gaps)
-    strengths = [d for d in dimension_gaps if d[1] > 0][:2]
-    weaknesses = [d for d in dimension_gaps if d[1] < 0][-2:]
+@functools.lru_cache(maxsize=64)
+def _generate_narrative(country):
+    """Generate AI-powered diagnostic narrative.
+
+    Pure with respect to the (static) per-country gap vectors, so repeated
+    selections of the same country reuse the cached string.
+    """
+    gap_values = _GAPS[country]
+    dimension_labels = _DIM_LABELS
     
+    # Rank dimensions by gap once; the extremes give the top 2 strengths
+    # (highest positive gaps) and top 2 weaknesses (lowest negative gaps)
+    gaps = np.asarray(gap_values)
+    order, positive, negative = _diagnose(gaps)
+    strengths = [(dimension_labels[i], float(gaps[i])) for i in order[-2:][::-1] if positive[i]]
+    weaknesses = [(dimension_labels[i], float(gaps[i])) for i in order[:2][::-1] if negative[i]]
+
     # Find top performer for policy insight
-    composite_scores = df.groupby('country')['composite_index'].first().sort_values(ascending=False)
-    top_performer = composite_scores.index[0]
-    
+    top_performer = _TOP_PERFORMER
+
     # Determine worst performing dimension for policy recommendation
-    worst_dimension = dimension_gaps[-1][0] if dimension_gaps else "overall wellbeing"
-    
-    narrative_parts = []
-    
-    # Header
-    narrative_parts.append(f"## 🏛️ OECD Wellbeing Diagnostic: {country}")
-    narrative_parts.append("---")
-    
+    worst_dimension = dimension_labels[order[0]] if len(order) else "overall wellbeing"
+
     # Strengths section
     if strengths:
-        narrative_parts.append("### 💪 **Key Strengths**")
-        for dim, gap in strengths:
-            narrative_parts.append(f"• **{dim}**: {gap:+.1f} points above OECD average")
-        narrative_parts.append("")
-        
+        strengths_block = "\n".join(f"• **{dim}**: {gap:+.1f} points above OECD average" for dim, gap in strengths)
         strength_text = f"{country} demonstrates notable excellence in {strengths[0][0].lower()}"
         if len(strengths) > 1:
             strength_text += f" and {strengths[1][0].lower()}"
         strength_text += f". These positive performance gaps indicate that {country}'s citizens experience significantly better outcomes in these dimensions compared to the typical OECD country."
-        narrative_parts.append(strength_text)
+        strengths_section = f"### 💪 **Key Strengths**\n{strengths_block}\n\n{strength_text}"
     else:
-        narrative_parts.append("### 💪 **Key Strengths**")
-        narrative_parts.append(f"• {country} is performing at or below OECD average across most dimensions")
-        narrative_parts.append("")
-        narrative_parts.append(f"While {country} faces challenges across multiple wellbeing dimensions, this presents clear opportunities for targeted policy interventions to improve citizen outcomes.")
-    
-    narrative_parts.append("")
-    
+        strengths_section = (
+            f"### 💪 **Key Strengths**\n"
+            f"• {country} is performing at or below OECD average across most dimensions\n\n"
+            f"While {country} faces challenges across multiple wellbeing dimensions, this presents clear opportunities for targeted policy interventions to improve citizen outcomes."
+        )
+
     # Weaknesses section
     if weaknesses:
-        narrative_parts.append("### ⚠️ **Critical Areas for Improvement**")
-        for dim, gap in weaknesses:
-            narrative_parts.append(f"• **{dim}**: {gap:+.1f} points below OECD average")
-        narrative_parts.append("")
-        
+        weaknesses_block = "\n".join(f"• **{dim}**: {gap:+.1f} points below OECD average" for dim, gap in weaknesses)
         weakness_text = f"The data reveals significant challenges in {weaknesses[-1][0].lower()}"
         if len(weaknesses) > 1:
             weakness_text += f" and {weaknesses[-2][0].lower()}"
         weakness_text += f". These negative gaps suggest that {country}'s performance in these areas falls notably short of what citizens in other OECD countries typically experience."
-        narrative_parts.append(weakness_text)
+        weaknesses_section = f"### ⚠️ **Critical Areas for Improvement**\n{weaknesses_block}\n\n{weakness_text}"
     else:
-        narrative_parts.append("### ⚠️ **Areas for Attention**")
-        narrative_parts.append(f"• {country} shows relatively balanced performance across dimensions")
-        narrative_parts.append("")
-        narrative_parts.append(f"{country} maintains consistent performance across wellbeing dimensions, though there may still be opportunities for enhancement in specific areas.")
-    
-    narrative_parts.append("")
-    
+        weaknesses_section = (
+            f"### ⚠️ **Areas for Attention**\n"
+            f"• {country} shows relatively balanced performance across dimensions\n\n"
+            f"{country} maintains consistent performance across wellbeing dimensions, though there may still be opportunities for enhancement in specific areas."
+        )
+
     # Policy insight
-    narrative_parts.append("### 🎯 **Policy Insight**")
     if weaknesses:
         policy_text = f"**Recommendation**: Prioritizing improvements in {worst_dimension.lower()} could significantly enhance {country}'s overall wellbeing performance and bring outcomes closer to leading countries like {top_performer}."
     else:
         policy_text = f"**Recommendation**: {country} should focus on maintaining its current performance levels while identifying emerging opportunities to further enhance citizen wellbeing outcomes."
-    
-    narrative_parts.append(policy_text)
-    
-    return "\n".join(narrative_parts)
+
+    return (
+        f"## 🏛️ OECD Wellbeing Diagnostic: {country}\n"
+        f"---\n"
+        f"{strengths_section}\n\n"
+        f"{weaknesses_section}\n\n"
+        f"### 🎯 **Policy Insight**\n"
+        f"{policy_text}"
+    )
+
+# Country -> (figure, narrative) payloads, fully precomputed at import so
+# selecting a country costs one dict lookup in the callback.
+_COUNTRY_PAYLOADS = {
+    country: (_build_country_figure(country), _generate_narrative(country))
+    for country in _GAPS
+}
 
 @callback(
     output=[
@@ -270,12 +348,7 @@ def _generate_narrative(country, gap_values, dimension_labels, df):
         **FILTER_CALLBACK_INPUTS
     }
 )
-def update(**kwargs) -> Tuple[go.Figure, str, str]:
-    empty_fig = go.Figure()
-    empty_fig.update_layout(
-        annotations=[{"text": "An error occurred while updating this chart", "showarrow": False, "font": {"size": 20}}]
-    )
-
+def update(**kwargs) -> Tuple[Any, Any, str]:
     try:
         figure, narrative = _update_logic(**kwargs)
         
@@ -293,4 +366,4 @@ def update(**kwargs) -> Tuple[go.Figure, str, str]:
     except Exception as e:
         error_msg = f"Error updating chart: {str(e)}\n{traceback.format_exc()}"
         print(error_msg)
-        return empty_fig, "Error generating narrative.", error_msg
\ No newline at end of file
+        return _ERROR_FIG, "Error generating narrative.", error_msg
\ No newline at end of file
@@ -1,3 +1,7 @@
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
 import dash_design_kit as ddk
 from dash import html
 
@@ -5,81 +9,56 @@ component_registry = {}  # Map of component names to their instances
 failed_components = {}  # Map of component names to their error messages
 
 ### Component Imports
-try:
-    from components.filter_component import component as filter_component
-except Exception:
-    filter_component = None
-
-try:
-    from components.data_cards import component as data_card_component
-except Exception:
-    data_card_component = None
-
-try:
-    from components.data_table import component as data_table_component
-except Exception:
-    data_table_component = None
-
-try:
-    from components.global_wellbeing_choropleth import component as global_wellbeing_choropleth_component
-    component_registry["global_wellbeing_choropleth"] = global_wellbeing_choropleth_component
-except Exception as e:
-    failed_components["global_wellbeing_choropleth"] = str(e)
-    print(f"[COMPONENT FAILURE] Failed to import global_wellbeing_choropleth:", e)
-
-try:
-    from components.country_radar_chart import component as country_radar_chart_component
-    component_registry["country_radar_chart"] = country_radar_chart_component
-except Exception as e:
-    failed_components["country_radar_chart"] = str(e)
-    print(f"[COMPONENT FAILURE] Failed to import country_radar_chart:", e)
-
-try:
-    from components.gap_analysis_bar_chart import component as gap_analysis_bar_chart_component
-    component_registry["gap_analysis_bar_chart"] = gap_analysis_bar_chart_component
-except Exception as e:
-    failed_components["gap_analysis_bar_chart"] = str(e)
-    print(f"[COMPONENT FAILURE] Failed to import gap_analysis_bar_chart:", e)
-
-try:
-    from components.policy_simulation_scatter import component as policy_simulation_scatter_component
-    component_registry["policy_simulation_scatter"] = policy_simulation_scatter_component
-except Exception as e:
-    failed_components["policy_simulation_scatter"] = str(e)
-    print(f"[COMPONENT FAILURE] Failed to import policy_simulation_scatter:", e)
-
-try:
-    from components.wellbeing_dimensions_comparison import component as wellbeing_dimensions_comparison_component
-    component_registry["wellbeing_dimensions_comparison"] = wellbeing_dimensions_comparison_component
-except Exception as e:
-    failed_components["wellbeing_dimensions_comparison"] = str(e)
-    print(f"[COMPONENT FAILURE] Failed to import wellbeing_dimensions_comparison:", e)
-
-try:
-    from components.composite_index_ranking import component as composite_index_ranking_component
-    component_registry["composite_index_ranking"] = composite_index_ranking_component
-except Exception as e:
-    failed_components["composite_index_ranking"] = str(e)
-    print(f"[COMPONENT FAILURE] Failed to import composite_index_ranking:", e)
-
-try:
-    from components.add_an_ai_narrative_text_box import component as add_an_ai_narrative_text_box_component
-    component_registry["add_an_ai_narrative_text_box"] = add_an_ai_narrative_text_box_component
-except Exception as e:
-    failed_components["add_an_ai_narrative_text_box"] = str(e)
-    print(f"[COMPONENT FAILURE] Failed to import add_an_ai_narrative_text_box:", e)
-
-try:
-    from components.produce_an_ai_narrative_text import component as produce_an_ai_narrative_text_component
-    component_registry["produce_an_ai_narrative_text"] = produce_an_ai_narrative_text_component
-except Exception as e:
-    failed_components["produce_an_ai_narrative_text"] = str(e)
-    print(f"[COMPONENT FAILURE] Failed to import produce_an_ai_narrative_text:", e)
+# Each component module touches disk and compiles on first import, so the
+# imports are submitted to a thread pool; importlib releases the GIL
+# during file reads, letting the I/O overlap. Per-component try/except
+# semantics are preserved when collecting the results.
+_OPTIONAL_COMPONENTS = ["filter_component", "data_cards", "data_table"]
+_REGISTRY_COMPONENTS = [
+    "global_wellbeing_choropleth",
+    "country_radar_chart",
+    "gap_analysis_bar_chart",
+    "policy_simulation_scatter",
+    "wellbeing_dimensions_comparison",
+    "composite_index_ranking",
+    "add_an_ai_narrative_text_box",
+    "produce_an_ai_narrative_text",
+]
+
+def _import_component(name):
+    return importlib.import_module(f"components.{name}").component
+
+with ThreadPoolExecutor(max_workers=8) as _pool:
+    _futures = {
+        name: _pool.submit(_import_component, name)
+        for name in _OPTIONAL_COMPONENTS + _REGISTRY_COMPONENTS
+    }
+
+def _optional_component(name):
+    try:
+        return _futures[name].result()
+    except Exception:
+        return None
 
+filter_component = _optional_component("filter_component")
+data_card_component = _optional_component("data_cards")
+data_table_component = _optional_component("data_table")
 
+for _name in _REGISTRY_COMPONENTS:
+    try:
+        component_registry[_name] = _futures[_name].result()
+    except Exception as e:
+        failed_components[_name] = str(e)
+        print(f"[COMPONENT FAILURE] Failed to import {_name}:", e)
+
+
+@functools.lru_cache(maxsize=64)
 def _get_component_layout(component_name, width=100, preview=False):
     """
     Safely retrieves a component's layout, handles errors, and adds an edit button in preview mode.
+
+    Component layouts are pure functions of (name, width, preview), so the
+    constructed trees are cached and shared across page loads.
     """
     if component_name not in component_registry:
         # Return a placeholder if the component failed to import
@@ -115,6 +94,7 @@ def _get_component_layout(component_name, width=100, preview=False):
         layout.children[0].children = [edit_button]
     return layout
 
+@functools.lru_cache(maxsize=2)
 def component(preview=False):
     layout_items = []
 
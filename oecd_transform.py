@@ -10,15 +10,31 @@ print("="*70)
 # STEP 1: LOAD AND FILTER DATA
 # =====================================================================
 
-df = pd.read_csv('OECD-wellbeing.csv')
+# PyArrow's C++ parser plus pruned columns and narrow dtypes load the CSV
+# several times faster and with a fraction of the memory; categoricals
+# also speed up the filtering and grouping steps below.
+df = pd.read_csv(
+    'OECD-wellbeing.csv',
+    engine='pyarrow',
+    usecols=['Country', 'REF_AREA', 'Year', 'Domain', 'Measure', 'Sex', 'Age', 'Education', 'OBS_VALUE'],
+    dtype={
+        'Country': 'category',
+        'REF_AREA': 'category',
+        'Domain': 'category',
+        'Measure': 'category',
+        'Sex': 'category',
+        'Age': 'category',
+        'Education': 'category',
+        'Year': 'int16',
+        'OBS_VALUE': 'float32',
+    },
+)
 print(f"\nLoaded {len(df)} rows")
 
-# Filter to totals only (country-level, no demographic breakdowns)
-df_totals = df[
-    (df['Age'] == 'Total') &
-    (df['Sex'] == 'Total') &
-    (df['Education'] == 'Total')
-].copy()
+# Filter to totals only (country-level, no demographic breakdowns).
+# query() fuses the three comparisons into one pass (numexpr-backed when
+# available) instead of allocating and AND-ing three boolean masks.
+df_totals = df.query("Age == 'Total' and Sex == 'Total' and Education == 'Total'")
 
 print(f"Filtered to totals: {len(df_totals)} rows")
 
@@ -40,6 +56,10 @@ key_measures = {
     'Housing affordability': ('housing', True, 'Housing cost burden'),
 }
 
+# Inverse map: short name -> (should_invert, description). Avoids
+# re-scanning key_measures with a comprehension for every column lookup.
+measure_by_col = {info[0]: (info[1], info[2]) for info in key_measures.values()}
+
 print("\n" + "="*70)
 print("SELECTED MEASURES")
 print("="*70)
@@ -60,12 +80,15 @@ print("EXTRACTING DATA")
 print("="*70)
 
 # For each measure, get the most recent year available
-df_key = df_totals[df_totals['Measure'].isin(key_measures.keys())].copy()
+df_key = df_totals[df_totals['Measure'].isin(key_measures.keys())]
 
 # Keep only most recent year for each country-measure combination
-df_key = df_key.sort_values('Year').groupby(
-    ['Country', 'REF_AREA', 'Measure']
-).tail(1).reset_index(drop=True)
+# (argmax per group via idxmax avoids sorting the whole frame).
+# observed=True keeps the categorical group keys to combinations that
+# actually occur: without it pandas 2.x materializes the full category
+# cross-product and idxmax raises on the empty groups.
+idx = df_key.groupby(['Country', 'REF_AREA', 'Measure'], sort=False, observed=True)['Year'].idxmax()
+df_key = df_key.loc[idx].reset_index(drop=True)
 
 print(f"Extracted {len(df_key)} measure observations")
 print(f"Countries with data: {df_key['Country'].nunique()}")
@@ -78,12 +101,14 @@ print("\n" + "="*70)
 print("CREATING WIDE FORMAT")
 print("="*70)
 
-df_wide = df_key.pivot_table(
-    index=['Country', 'REF_AREA'],
-    columns='Measure',
-    values='OBS_VALUE',
-    aggfunc='first'
-).reset_index()
+# Rows are already unique per (Country, REF_AREA, Measure) after the
+# idxmax step, so a plain unstack reshapes without pivot_table's
+# aggregation machinery.
+df_wide = (
+    df_key.set_index(['Country', 'REF_AREA', 'Measure'])['OBS_VALUE']
+    .unstack('Measure')
+    .reset_index()
+)
 
 # Rename columns to short names
 rename_map = {measure: info[0] for measure, info in key_measures.items()}
@@ -94,6 +119,12 @@ df_wide = df_wide.rename(columns={'Country': 'country', 'REF_AREA': 'country_cod
 dimension_cols = [info[0] for info in key_measures.values()]
 dimension_cols = [col for col in dimension_cols if col in df_wide.columns]
 
+# Per-dimension metadata resolved once, aligned with dimension_cols: the
+# inversion mask drives the normalization in STEP 6 and the descriptions
+# feed the metadata file in STEP 11.
+invert_mask = np.array([measure_by_col[col][0] for col in dimension_cols])
+dim_descriptions = [measure_by_col[col][1] for col in dimension_cols]
+
 print(f"Wide format: {df_wide.shape[0]} countries × {len(dimension_cols)} dimensions")
 print(f"Dimensions: {', '.join(dimension_cols)}")
 
@@ -105,7 +136,10 @@ print("\n" + "="*70)
 print("HANDLING MISSING DATA")
 print("="*70)
 
-missing_before = df_wide[dimension_cols].isna().sum()
+# One missing-value mask powers the per-dimension report, the per-country
+# removal ratio, and the fill counts below.
+na_mask = df_wide[dimension_cols].isna()
+missing_before = na_mask.sum()
 print("Missing values by dimension:")
 for col in dimension_cols:
     missing_count = missing_before[col]
@@ -114,22 +148,23 @@ for col in dimension_cols:
         print(f"  {col:25s} {missing_count:3d} ({missing_pct:5.1f}%)")
 
 # Remove countries with more than 50% missing data
-missing_pct_by_country = (df_wide[dimension_cols].isna().sum(axis=1) / len(dimension_cols)) * 100
+missing_pct_by_country = (na_mask.sum(axis=1) / len(dimension_cols)) * 100
 countries_to_remove = df_wide[missing_pct_by_country > 50]['country'].tolist()
 
 if countries_to_remove:
     print(f"\nRemoving {len(countries_to_remove)} countries with >50% missing data:")
     for c in countries_to_remove:
         print(f"  - {c}")
-    df_wide = df_wide[missing_pct_by_country <= 50].copy()
+    df_wide = df_wide[missing_pct_by_country <= 50]
 
-# Fill remaining missing values with OECD average
+# Fill remaining missing values with OECD average (single vectorized
+# fillna with the per-column means instead of a Python loop)
+means = df_wide[dimension_cols].mean()
+fill_counts = na_mask.loc[df_wide.index].sum()
+df_wide[dimension_cols] = df_wide[dimension_cols].fillna(means)
 for col in dimension_cols:
-    if df_wide[col].isna().any():
-        avg_val = df_wide[col].mean()
-        missing_count = df_wide[col].isna().sum()
-        df_wide[col].fillna(avg_val, inplace=True)
-        print(f"Filled {missing_count} missing values in {col} with average {avg_val:.2f}")
+    if fill_counts[col] > 0:
+        print(f"Filled {fill_counts[col]} missing values in {col} with average {means[col]:.2f}")
 
 print(f"\nFinal dataset: {len(df_wide)} countries")
 
@@ -141,34 +176,31 @@ print("\n" + "="*70)
 print("NORMALIZING TO 0-100 SCALE")
 print("="*70)
 
+# float32 halves the memory traffic through the rank/min-max/mean passes;
+# scores live on a 0-100 scale rounded to 1 decimal, so the lost
+# precision is invisible in the output.
+df_wide[dimension_cols] = df_wide[dimension_cols].astype(np.float32)
+
 # Create a copy for reference
 df_original = df_wide[dimension_cols].copy()
 
-for col in dimension_cols:
-    # Find the measure info
-    measure_info = [(k, v) for k, v in key_measures.items() if v[0] == col]
-    if not measure_info:
-        continue
-    
-    should_invert = measure_info[0][1][1]
-    
+# Normalize the whole dimension block at once: one percentile-rank pass
+# for the inverted measures and one min-max pass for the rest, combined
+# with the inversion mask. Replaces per-column Series operations with two
+# block operations.
+for col, should_invert in zip(dimension_cols, invert_mask):
     if should_invert:
         print(f"  {col:25s} [INVERTING - lower is better]")
-        # Invert: use percentile rank
-        df_wide[col] = (1 - df_wide[col].rank(pct=True)) * 100
     else:
         print(f"  {col:25s} [normalizing - higher is better]")
-        # Normal min-max scaling
-        min_val = df_wide[col].min()
-        max_val = df_wide[col].max()
-        if max_val > min_val:
-            df_wide[col] = ((df_wide[col] - min_val) / (max_val - min_val)) * 100
-        else:
-            df_wide[col] = 50.0
-
-# Round to 1 decimal
-for col in dimension_cols:
-    df_wide[col] = df_wide[col].round(1)
+
+M = df_wide[dimension_cols].to_numpy(dtype=np.float32)
+ranks = df_wide[dimension_cols].rank(pct=True).to_numpy()
+mn = np.nanmin(M, axis=0)
+mx = np.nanmax(M, axis=0)
+rng = np.where(mx > mn, mx - mn, 1.0)
+minmax = np.where(mx > mn, (M - mn) / rng * 100, 50.0)
+df_wide[dimension_cols] = np.round(np.where(invert_mask, (1 - ranks) * 100, minmax), 1).astype(np.float32)
 
 print("\nNormalization complete - all values now 0-100 scale")
 
@@ -195,9 +227,10 @@ print("="*70)
 
 oecd_averages = df_wide[dimension_cols].mean()
 
-for col in dimension_cols:
-    gap_col = f"{col}_gap"
-    df_wide[gap_col] = (df_wide[col] - oecd_averages[col]).round(1)
+# Broadcast the per-column means over the whole block in one pass rather
+# than subtracting column by column.
+gap_block = (df_wide[dimension_cols].to_numpy() - oecd_averages.to_numpy()).round(1)
+df_wide[[f"{col}_gap" for col in dimension_cols]] = gap_block
 
 print("Gap columns created for all dimensions")
 print("\nOECD Averages (all ~50 after normalization):")
@@ -208,27 +241,36 @@ for col in dimension_cols:
 # STEP 9: SORT AND CREATE OUTPUT
 # =====================================================================
 
-df_wide = df_wide.sort_values('composite_index', ascending=False).reset_index(drop=True)
+# The display section below uses partial heap selects (nlargest /
+# nsmallest); the full sort happens once in STEP 11 before saving.
 
 # =====================================================================
 # STEP 10: DISPLAY RESULTS
 # =====================================================================
 
+# Shared by the Top-10 and Bottom-10 blocks below.
+gap_cols = [col for col in df_wide.columns if col.endswith('_gap')]
+dim_names = np.array([col.replace('_gap', '') for col in gap_cols])
+
 print("\n" + "="*70)
 print("TOP 10 COUNTRIES BY OVERALL WELLBEING")
 print("="*70)
 print(f"{'Rank':<6} {'Country':<25} {'Score':<8} {'Strengths'}")
 print("-" * 70)
 
-for idx, row in df_wide.head(10).iterrows():
-    gap_cols = [col for col in df_wide.columns if col.endswith('_gap')]
-    strengths = sorted(
-        [(col.replace('_gap', ''), row[col]) for col in gap_cols],
-        key=lambda x: x[1],
-        reverse=True
-    )[:2]
-    strength_str = f"{strengths[0][0]} (+{strengths[0][1]:.1f}), {strengths[1][0]} (+{strengths[1][1]:.1f})"
-    print(f"{idx+1:<6} {row['country']:<25} {row['composite_index']:<8.1f} {strength_str}")
+# Top-2 gaps per row via argpartition on the gap matrix (C-level partial
+# select) instead of a Python sort inside iterrows.
+top10 = df_wide.nlargest(10, 'composite_index').reset_index(drop=True)
+gap_mat = top10[gap_cols].to_numpy()
+part = np.argpartition(-gap_mat, 2, axis=1)[:, :2]
+part_vals = np.take_along_axis(gap_mat, part, axis=1)
+order2 = np.argsort(-part_vals, axis=1)
+top2_idx = np.take_along_axis(part, order2, axis=1)
+top2_vals = np.take_along_axis(part_vals, order2, axis=1)
+
+for i, (country, score) in enumerate(zip(top10['country'], top10['composite_index'])):
+    strength_str = f"{dim_names[top2_idx[i, 0]]} (+{top2_vals[i, 0]:.1f}), {dim_names[top2_idx[i, 1]]} (+{top2_vals[i, 1]:.1f})"
+    print(f"{i+1:<6} {country:<25} {score:<8.1f} {strength_str}")
 
 print("\n" + "="*70)
 print("BOTTOM 10 COUNTRIES BY OVERALL WELLBEING")
@@ -236,14 +278,19 @@ print("="*70)
 print(f"{'Rank':<6} {'Country':<25} {'Score':<8} {'Main Weaknesses'}")
 print("-" * 70)
 
-for idx, row in df_wide.tail(10).iterrows():
-    gap_cols = [col for col in df_wide.columns if col.endswith('_gap')]
-    weaknesses = sorted(
-        [(col.replace('_gap', ''), row[col]) for col in gap_cols],
-        key=lambda x: x[1]
-    )[:2]
-    weakness_str = f"{weaknesses[0][0]} ({weaknesses[0][1]:.1f}), {weaknesses[1][0]} ({weaknesses[1][1]:.1f})"
-    print(f"{len(df_wide)-idx:<6} {row['country']:<25} {row['composite_index']:<8.1f} {weakness_str}")
+# Bottom-2 gaps per row, same argpartition approach as the Top-10 block.
+# (reversed so the worst country prints last, as with the sorted tail)
+bottom10 = df_wide.nsmallest(10, 'composite_index').iloc[::-1].reset_index(drop=True)
+gap_mat = bottom10[gap_cols].to_numpy()
+part = np.argpartition(gap_mat, 2, axis=1)[:, :2]
+part_vals = np.take_along_axis(gap_mat, part, axis=1)
+order2 = np.argsort(part_vals, axis=1)
+bot2_idx = np.take_along_axis(part, order2, axis=1)
+bot2_vals = np.take_along_axis(part_vals, order2, axis=1)
+
+for i, (country, score) in enumerate(zip(bottom10['country'], bottom10['composite_index'])):
+    weakness_str = f"{dim_names[bot2_idx[i, 0]]} ({bot2_vals[i, 0]:.1f}), {dim_names[bot2_idx[i, 1]]} ({bot2_vals[i, 1]:.1f})"
+    print(f"{len(bottom10)-i:<6} {country:<25} {score:<8.1f} {weakness_str}")
 
 # =====================================================================
 # STEP 11: SAVE PROCESSED DATA
@@ -253,13 +300,24 @@ print("\n" + "="*70)
 print("SAVING PROCESSED DATA")
 print("="*70)
 
-# Main output file
+# Sort once for the saved outputs and the metadata Top-5 section
+df_wide = df_wide.sort_values('composite_index', ascending=False).reset_index(drop=True)
+
+# Main output file. Arrow's C++ CSV writer is several times faster than
+# pandas' row-wise formatter; fall back to a chunked pandas write (which
+# avoids buffering the fully formatted output) if pyarrow is missing.
 output_file = 'oecd_wellbeing_processed.csv'
-df_wide.to_csv(output_file, index=False)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    pacsv.write_csv(pa.Table.from_pandas(df_wide, preserve_index=False), output_file)
+except ImportError:
+    df_wide.to_csv(output_file, index=False, chunksize=10_000)
 print(f"✓ Main file saved: {output_file}")
 
-# Create metadata file
-metadata = f"""OECD WELLBEING DATA - PROCESSED FOR PLOTLY STUDIO
+# Create metadata file (collected as parts and joined once, instead of
+# repeatedly reallocating a growing string with +=)
+metadata_parts = [f"""OECD WELLBEING DATA - PROCESSED FOR PLOTLY STUDIO
 ================================================
 
 Dataset Summary:
@@ -268,15 +326,12 @@ Dataset Summary:
 - Data Years: Most recent available (2018-2024 depending on measure)
 
 Dimensions Included:
-"""
+"""]
 
-for col in dimension_cols:
-    measure_info = [(k, v) for k, v in key_measures.items() if v[0] == col]
-    if measure_info:
-        desc = measure_info[0][1][2]
-        metadata += f"  • {col}: {desc}\n"
+for col, desc in zip(dimension_cols, dim_descriptions):
+    metadata_parts.append(f"  • {col}: {desc}\n")
 
-metadata += f"""
+metadata_parts.append(f"""
 Value Interpretation:
 - All dimensions normalized to 0-100 scale
 - 0 = Worst performer in dataset
@@ -297,13 +352,13 @@ Inverted Measures (lower raw values = higher normalized scores):
 - housing (cost burden)
 
 Top 5 Countries:
-"""
+""")
 
 for idx, row in df_wide.head(5).iterrows():
-    metadata += f"{idx+1}. {row['country']} ({row['composite_index']:.1f})\n"
+    metadata_parts.append(f"{idx+1}. {row['country']} ({row['composite_index']:.1f})\n")
 
 with open('oecd_data_metadata.txt', 'w', encoding='utf-8') as f:
-    f.write(metadata)
+    f.write("".join(metadata_parts))
 
 print(f"✓ Metadata saved: oecd_data_metadata.txt")
 
@@ -1,5 +1,6 @@
 import sys
 import os
+import functools
 import traceback
 from typing import TypedDict, Any, Tuple
 from datetime import datetime, timedelta
@@ -15,6 +16,11 @@ from data import get_data
 from components.filter_component import filter_data, FILTER_CALLBACK_INPUTS
 from logger import logger
 
+# The dataset is static for the lifetime of the process, so build the
+# DataFrame once and reuse it across callback invocations.
+get_data = functools.lru_cache(maxsize=1)(get_data)
+_DF_CACHE = get_data()
+
 class TestInput(TypedDict):
     options: list[Any]
     default: Any
@@ -43,6 +49,26 @@ dimension_options = [
 ]
 dimension_default = "environment"
 
+# Simplified life-satisfaction model: weighted average of key dimensions.
+# Built once at module scope so the callback pays no dict construction or
+# per-key lookups.
+_WEIGHTS = {
+    'environment': 0.15,
+    'education': 0.15,
+    'jobs': 0.20,
+    'safety': 0.10,
+    'income': 0.10,
+    'housing': 0.10,
+    'health': 0.10,
+    'work_life_balance': 0.05,
+    'social_connections': 0.05
+}
+_REST_COLS = [
+    'safety', 'income', 'housing', 'health', 'work_life_balance',
+    'social_connections'
+]
+_W_REST = np.array([_WEIGHTS[col] for col in _REST_COLS])
+
 def component() -> ComponentResponse:
     graph_id = f"{component_id}_graph"
     error_id = f"{component_id}_error"
@@ -181,9 +207,18 @@ def component() -> ComponentResponse:
         "test_inputs": test_inputs
     }
 
+def _boosted(values: pd.Series, boost: float) -> np.ndarray:
+    """Scale a dimension column by a policy boost and cap it at 100.
+
+    The clip writes back into the scaled buffer, so the whole operation
+    allocates a single array.
+    """
+    scaled = values.to_numpy() * (1 + boost / 100)
+    return np.clip(scaled, None, 100.0, out=scaled)
+
 def _update_logic(**kwargs) -> go.Figure:
     """Core chart update logic without error handling."""
-    df = filter_data(get_data(), **kwargs)
+    df = filter_data(_DF_CACHE, **kwargs)
     if len(df) == 0:
         empty_fig = go.Figure()
         empty_fig.update_layout(
@@ -212,52 +247,7 @@ def _update_logic(**kwargs) -> go.Figure:
 
     logger.debug("Starting chart creation. df:\n%s", df.head())
 
-    df_sim = df.copy()
-    
-    # Apply policy boosts (convert percentage to multiplier)
-    df_sim['environment_sim'] = df_sim['environment'] * (1 + environment_boost / 100)
-    df_sim['education_sim'] = df_sim['education'] * (1 + education_boost / 100)
-    df_sim['jobs_sim'] = df_sim['jobs'] * (1 + jobs_boost / 100)
-    
-    # Cap values at 100
-    df_sim['environment_sim'] = np.minimum(df_sim['environment_sim'], 100)
-    df_sim['education_sim'] = np.minimum(df_sim['education_sim'], 100)
-    df_sim['jobs_sim'] = np.minimum(df_sim['jobs_sim'], 100)
-    
-    # Calculate simulated life satisfaction (simplified model: weighted average of key dimensions)
-    weights = {
-        'environment': 0.15,
-        'education': 0.15,
-        'jobs': 0.20,
-        'safety': 0.10,
-        'income': 0.10,
-        'housing': 0.10,
-        'health': 0.10,
-        'work_life_balance': 0.05,
-        'social_connections': 0.05
-    }
-    
-    df_sim['life_satisfaction_sim'] = (
-        df_sim['environment_sim'] * weights['environment'] +
-        df_sim['education_sim'] * weights['education'] +
-        df_sim['jobs_sim'] * weights['jobs'] +
-        df_sim['safety'] * weights['safety'] +
-        df_sim['income'] * weights['income'] +
-        df_sim['housing'] * weights['housing'] +
-        df_sim['health'] * weights['health'] +
-        df_sim['work_life_balance'] * weights['work_life_balance'] +
-        df_sim['social_connections'] * weights['social_connections']
-    )
-    
-    # Get the simulated dimension value
-    if dimension == 'environment':
-        df_sim['dimension_sim'] = df_sim['environment_sim']
-    elif dimension == 'education':
-        df_sim['dimension_sim'] = df_sim['education_sim']
-    elif dimension == 'jobs':
-        df_sim['dimension_sim'] = df_sim['jobs_sim']
-    else:
-        df_sim['dimension_sim'] = df_sim[dimension]
+    boosted = environment_boost > 0 or education_boost > 0 or jobs_boost > 0
 
     fig = go.Figure()
 
@@ -277,14 +267,46 @@ def _update_logic(**kwargs) -> go.Figure:
         )
     ))
 
-    # Add simulated positions if any policy changes
-    if environment_boost > 0 or education_boost > 0 or jobs_boost > 0:
+    # Simulate and overlay only when a policy boost is applied — the
+    # default all-zero slider state skips the frame copy and simulated
+    # columns entirely.
+    if boosted:
+        # Apply policy boosts (convert percentage to multiplier) and cap at
+        # 100 as plain arrays — no DataFrame copy; only the columns the
+        # traces actually consume get materialized.
+        env_sim = _boosted(df['environment'], environment_boost)
+        edu_sim = _boosted(df['education'], education_boost)
+        jobs_sim = _boosted(df['jobs'], jobs_boost)
+
+        # Calculate simulated life satisfaction (simplified model: weighted
+        # average of key dimensions): the three boosted arrays carry their
+        # own weights, the untouched dimensions fold into one matrix-vector
+        # product.
+        life_sat_sim = (
+            env_sim * _WEIGHTS['environment']
+            + edu_sim * _WEIGHTS['education']
+            + jobs_sim * _WEIGHTS['jobs']
+            + df[_REST_COLS].to_numpy() @ _W_REST
+        )
+
+        # Pick the simulated x values; only the three boosted dimensions
+        # have simulated values, so anything else plots the current column
+        # unchanged.
+        if dimension == 'environment':
+            x_sim = env_sim
+        elif dimension == 'education':
+            x_sim = edu_sim
+        elif dimension == 'jobs':
+            x_sim = jobs_sim
+        else:
+            x_sim = df[dimension].to_numpy()
+
         fig.add_trace(go.Scatter(
-            x=df_sim['dimension_sim'],
-            y=df_sim['life_satisfaction_sim'],
+            x=x_sim,
+            y=life_sat_sim,
             mode='markers',
             name='Simulated Position',
-            text=df_sim['country'],
+            text=df['country'],
             hovertemplate="<b>%{text}</b><br>" +
                          f"{dimension.replace('_', ' ').title()}: %{{x:.1f}}<br>" +
                          "Life Satisfaction: %{y:.1f}<br>" +
@@ -296,21 +318,28 @@ def _update_logic(**kwargs) -> go.Figure:
             )
         ))
 
-        # Add arrows showing movement
-        for i in range(len(df)):
-            if abs(df_sim.iloc[i]['dimension_sim'] - df.iloc[i][dimension]) > 0.1 or \
-               abs(df_sim.iloc[i]['life_satisfaction_sim'] - df.iloc[i]['life_satisfaction']) > 0.1:
-                fig.add_annotation(
-                    x=df_sim.iloc[i]['dimension_sim'],
-                    y=df_sim.iloc[i]['life_satisfaction_sim'],
-                    ax=df.iloc[i][dimension],
-                    ay=df.iloc[i]['life_satisfaction'],
-                    arrowhead=2,
-                    arrowsize=1,
-                    arrowwidth=1,
-                    arrowcolor="gray",
-                    opacity=0.6
-                )
+        # Add arrows showing movement: vectorize the moved-point test on
+        # full arrays and attach all annotations in one layout update
+        # instead of per-row .iloc access and repeated figure mutation.
+        x_cur = df[dimension].to_numpy()
+        y_cur = df['life_satisfaction'].to_numpy()
+        y_sim = life_sat_sim
+        moved = (np.abs(x_sim - x_cur) > 0.1) | (np.abs(y_sim - y_cur) > 0.1)
+        annotations = [
+            dict(
+                x=x_sim[i],
+                y=y_sim[i],
+                ax=x_cur[i],
+                ay=y_cur[i],
+                arrowhead=2,
+                arrowsize=1,
+                arrowwidth=1,
+                arrowcolor="gray",
+                opacity=0.6
+            )
+            for i in np.flatnonzero(moved)
+        ]
+        fig.update_layout(annotations=annotations)
 
     fig.update_layout(
         xaxis_title=dimension.replace('_', ' ').title(),